@@ -176,6 +176,7 @@ BACKEND_ATTRIBUTES = {
         "expm",
         "fractional_matrix_power",
         "inv",
+        "is_pd",
         "is_single_matrix_pd",
         "logm",
         "norm",
@@ -4,6 +4,7 @@ import functools as _functools
 
 import autograd.numpy as _np
 import autograd.scipy as _ascp
+import scipy as _scipy
 from autograd.extend import defvjp as _defvjp
 from autograd.extend import primitive as _primitive
 from autograd.numpy.linalg import (  # NOQA
@@ -24,8 +25,6 @@ from ._common import atol
 from ._common import to_ndarray as _to_ndarray
 from ._dtype import _cast_fout_to_input_dtype, _cast_out_to_input_dtype
 
-_diag_vec = _np.vectorize(_np.diag, signature="(n)->(n,n)")
-
 _logm_vec = _cast_fout_to_input_dtype(
     target=_np.vectorize(_ascp.linalg.logm, signature="(n,m)->(n,m)")
 )
@@ -33,10 +32,12 @@ _logm_vec = _cast_fout_to_input_dtype(
 
 def _is_symmetric(x, tol=1e-12):
     new_x = _to_ndarray(x, to_ndim=3)
+    if not (_np.abs(new_x[:, 0, :] - new_x[:, :, 0]) < tol).all():
+        return False
     return (_np.abs(new_x - _np.transpose(new_x, axes=(0, 2, 1))) < tol).all()
 
 
-def _adjoint(_ans, x, fn):
+def _adjoint(_ans, x, fn, **kwargs):
     vectorized = x.ndim == 3
     axes = (0, 2, 1) if vectorized else (1, 0)
 
@@ -57,17 +58,19 @@ _defvjp(expm, _expm_vjp)
 
 
 @_primitive
-def logm(x):
+def logm(x, *, symmetric=None):
     ndim = x.ndim
     new_x = _to_ndarray(x, to_ndim=3)
-    if _is_symmetric(new_x):
+    if symmetric is None:
+        symmetric = _is_symmetric(new_x)
+
+    if symmetric:
         eigvals, eigvecs = _np.linalg.eigh(new_x)
         if (eigvals > 0).all():
-            eigvals = _np.log(eigvals)
-            eigvals = _diag_vec(eigvals)
             transp_eigvecs = _np.transpose(eigvecs, axes=(0, 2, 1))
-            result = _np.matmul(eigvecs, eigvals)
-            result = _np.matmul(result, transp_eigvecs)
+            result = _np.matmul(
+                eigvecs * _np.log(eigvals)[..., None, :], transp_eigvecs
+            )
         else:
             result = _logm_vec(new_x)
     else:
@@ -131,6 +134,28 @@ def is_single_matrix_pd(mat):
         raise e
 
 
+def is_pd(mat):
+    """Check if square matrices are positive definite."""
+    if mat.shape[-2] != mat.shape[-1]:
+        return _np.zeros(mat.shape[:-2], dtype=bool)
+    if mat.dtype in [_np.complex64, _np.complex128]:
+        is_hermitian = _np.all(
+            _np.abs(mat - _np.conj(_np.swapaxes(mat, -2, -1))) < atol, axis=(-2, -1)
+        )
+        eigvals = _np.linalg.eigvalsh(mat)
+        return _np.logical_and(is_hermitian, _np.min(_np.real(eigvals), axis=-1) > 0)
+    try:
+        _np.linalg.cholesky(mat)
+        return _np.ones(mat.shape[:-2], dtype=bool)
+    except _np.linalg.LinAlgError:
+        pass
+
+    potrf = _scipy.linalg.lapack.get_lapack_funcs("potrf", (mat,))
+    flat_mat = _np.reshape(mat, (-1,) + mat.shape[-2:])
+    is_pd_ = _np.array([potrf(m, lower=True)[1] == 0 for m in flat_mat])
+    return _np.reshape(is_pd_, mat.shape[:-2])
+
+
 @_cast_out_to_input_dtype
 def fractional_matrix_power(A, t):
     if A.ndim == 2:
@@ -14,22 +14,49 @@ from numpy.linalg import (  # NOQA
     solve,
     svd,
 )
-from scipy.linalg import expm
 
 from ._common import atol
 from ._common import to_ndarray as _to_ndarray
 from ._dtype import _cast_fout_to_input_dtype, _cast_out_to_input_dtype
 
-_diag_vec = _np.vectorize(_np.diag, signature="(n)->(n,n)")
+_EIGH_2X2_MIN_BATCH = 64
 
 
-_logm_vec = _cast_fout_to_input_dtype(
-    target=_np.vectorize(_scipy.linalg.logm, signature="(n,m)->(n,m)")
-)
+def _apply_matrixwise(func, *mats):
+    """Apply a function of single matrices over the broadcast batch axes.
+
+    Explicit loop writing into a preallocated output, avoiding the dispatch
+    overhead of `np.vectorize`. As for `np.vectorize`, the output dtype is
+    the one of the first result.
+    """
+    batch_shape = _np.broadcast_shapes(*[mat.shape[:-2] for mat in mats])
+    if not batch_shape:
+        return func(*mats)
+
+    mats = [
+        _np.broadcast_to(mat, batch_shape + mat.shape[-2:]).reshape(
+            (-1,) + mat.shape[-2:]
+        )
+        for mat in mats
+    ]
+    first = func(*[mat[0] for mat in mats])
+    out = _np.empty((mats[0].shape[0],) + first.shape, dtype=first.dtype)
+    out[0] = first
+    for i in range(1, out.shape[0]):
+        out[i] = func(*[mat[i] for mat in mats])
+
+    return out.reshape(batch_shape + first.shape)
+
+
+@_cast_fout_to_input_dtype
+def _logm_vec(x):
+    return _apply_matrixwise(_scipy.linalg.logm, x)
 
 
 def _is_symmetric(x, tol=atol):
     new_x = _to_ndarray(x, to_ndim=3)
+    if not (_np.abs(new_x[:, 0, :] - new_x[:, :, 0]) < tol).all():
+        return False
     return (_np.abs(new_x - _np.transpose(new_x, axes=(0, 2, 1))) < tol).all()
 
 
@@ -38,18 +65,57 @@ def _is_hermitian(x, tol=atol):
     return (_np.abs(new_x - _np.conj(_np.transpose(new_x, axes=(0, 2, 1)))) < tol).all()
 
 
-def logm(x):
+def _eigh_2x2(x):
+    """Compute eigenvalues and eigenvectors of symmetric 2x2 matrices.
+
+    Closed-form expressions, evaluated on the whole batch at once.
+    Eigenvalues are returned in ascending order, as for `eigh`.
+    """
+    half_trace = (x[..., 0, 0] + x[..., 1, 1]) / 2
+    half_diff = (x[..., 0, 0] - x[..., 1, 1]) / 2
+    off_diag = x[..., 0, 1]
+
+    radius = _np.hypot(half_diff, off_diag)
+    eigvals = _np.stack([half_trace - radius, half_trace + radius], axis=-1)
+
+    angle = _np.arctan2(off_diag, half_diff) / 2
+    cos, sin = _np.cos(angle), _np.sin(angle)
+    eigvecs = _np.stack(
+        [_np.stack([-sin, cos], axis=-1), _np.stack([cos, sin], axis=-1)], axis=-1
+    )
+    return eigvals, eigvecs
+
+
+def _eigh(x):
+    """Compute eigh, in closed form for large batches of 2x2 matrices.
+
+    Below `_EIGH_2X2_MIN_BATCH` matrices, a single LAPACK call is cheaper.
+    """
+    if x.shape[-1] == 2 and x[..., 0, 0].size >= _EIGH_2X2_MIN_BATCH:
+        return _eigh_2x2(x)
+    return _np.linalg.eigh(x)
+
+
+def expm(x):
+    return _scipy.linalg.expm(_np.require(x, requirements=["C", "W"]))
+
+
+def logm(x, *, symmetric=None):
     ndim = x.ndim
     new_x = _to_ndarray(x, to_ndim=3)
 
-    if _is_symmetric(new_x) and new_x.dtype not in [_np.complex64, _np.complex128]:
-        eigvals, eigvecs = _np.linalg.eigh(new_x)
+    if new_x.dtype in [_np.complex64, _np.complex128]:
+        symmetric = False
+    elif symmetric is None:
+        symmetric = _is_symmetric(new_x)
+
+    if symmetric:
+        eigvals, eigvecs = _eigh(new_x)
         if (eigvals > 0).all():
-            eigvals = _np.log(eigvals)
-            eigvals = _diag_vec(eigvals)
             transp_eigvecs = _np.transpose(eigvecs, axes=(0, 2, 1))
-            result = _np.matmul(eigvecs, eigvals)
-            result = _np.matmul(result, transp_eigvecs)
+            result = _np.matmul(
+                eigvecs * _np.log(eigvals)[..., None, :], transp_eigvecs
+            )
         else:
             result = _logm_vec(new_x)
     else:
@@ -60,26 +126,52 @@ def logm(x):
     return result
 
 
+def _solve_sylvester_shared(a, b, q):
+    """Solve Sylvester equations for a batch of `q` with single `a` and `b`.
+
+    Bartels-Stewart algorithm as in `scipy.linalg.solve_sylvester`, where
+    the Schur decompositions of `a` and `b` are computed only once.
+    """
+    r, u = _scipy.linalg.schur(a, output="real")
+    s, v = _scipy.linalg.schur(_np.conj(b).T, output="real")
+    f = _np.conj(u).T @ q @ v
+
+    trsyl = _scipy.linalg.get_lapack_funcs("trsyl", (r, s, f))
+
+    def _solve_triangular_sylvester(f_):
+        y, scale, info = trsyl(r, s, f_, tranb="C")
+        if info < 0:
+            raise _np.linalg.LinAlgError(
+                f"Illegal value encountered in the {-info} term"
+            )
+        return scale * y
+
+    y = _apply_matrixwise(_solve_triangular_sylvester, f)
+    return u @ y @ _np.conj(v).T
+
+
 def solve_sylvester(a, b, q, tol=atol):
     if a.shape == b.shape:
         axes = (0, 2, 1) if a.ndim == 3 else (1, 0)
         if _np.all(_np.isclose(a, b)) and _np.all(
             _np.abs(a - _np.transpose(a, axes)) < tol
         ):
-            eigvals, eigvecs = eigh(a)
+            eigvals, eigvecs = _eigh(a)
             if _np.all(eigvals >= tol):
-                tilde_q = _np.transpose(eigvecs, axes) @ q @ eigvecs
+                transp_eigvecs = _np.transpose(eigvecs, axes)
+                tilde_q = transp_eigvecs @ q @ eigvecs
                 tilde_x = tilde_q / (eigvals[..., :, None] + eigvals[..., None, :])
-                return eigvecs @ tilde_x @ _np.transpose(eigvecs, axes)
+                return eigvecs @ tilde_x @ transp_eigvecs
 
-    return _np.vectorize(
-        _scipy.linalg.solve_sylvester, signature="(m,m),(n,n),(m,n)->(m,n)"
-    )(a, b, q)
+    if a.ndim == 2 and b.ndim == 2 and q.ndim > 2:
+        return _solve_sylvester_shared(a, b, q)
+
+    return _apply_matrixwise(_scipy.linalg.solve_sylvester, a, b, q)
 
 
 @_cast_fout_to_input_dtype
 def sqrtm(x):
-    return _np.vectorize(_scipy.linalg.sqrtm, signature="(n,m)->(n,m)")(x)
+    return _apply_matrixwise(_scipy.linalg.sqrtm, x)
 
 
 def quadratic_assignment(a, b, options):
@@ -110,6 +202,28 @@ def is_single_matrix_pd(mat):
         raise e
 
 
+def is_pd(mat):
+    """Check if square matrices are positive definite."""
+    if mat.shape[-2] != mat.shape[-1]:
+        return _np.zeros(mat.shape[:-2], dtype=bool)
+    if mat.dtype in [_np.complex64, _np.complex128]:
+        is_hermitian = _np.all(
+            _np.abs(mat - _np.conj(_np.swapaxes(mat, -2, -1))) < atol, axis=(-2, -1)
+        )
+        eigvals = _np.linalg.eigvalsh(mat)
+        return _np.logical_and(is_hermitian, _np.min(_np.real(eigvals), axis=-1) > 0)
+    try:
+        _np.linalg.cholesky(mat)
+        return _np.ones(mat.shape[:-2], dtype=bool)
+    except _np.linalg.LinAlgError:
+        pass
+
+    potrf = _scipy.linalg.lapack.get_lapack_funcs("potrf", (mat,))
+    flat_mat = _np.reshape(mat, (-1,) + mat.shape[-2:])
+    is_pd_ = _np.array([potrf(m, lower=True)[1] == 0 for m in flat_mat])
+    return _np.reshape(is_pd_, mat.shape[:-2])
+
+
 @_cast_out_to_input_dtype
 def fractional_matrix_power(A, t):
     if A.ndim == 2:
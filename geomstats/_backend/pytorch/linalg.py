@@ -17,16 +17,16 @@ class _Logm(_torch.autograd.Function):
     """
 
     @staticmethod
-    def _logm(x):
-        np_logm = _gsnplinalg.logm(x.detach().cpu())
+    def _logm(x, symmetric=None):
+        np_logm = _gsnplinalg.logm(x.detach().cpu(), symmetric=symmetric)
         torch_logm = _torch.from_numpy(np_logm).to(x.device, dtype=x.dtype)
         return torch_logm
 
     @staticmethod
-    def forward(ctx, tensor):
+    def forward(ctx, tensor, symmetric=None):
         """Apply matrix logarithm to a tensor."""
         ctx.save_for_backward(tensor)
-        return _Logm._logm(tensor)
+        return _Logm._logm(tensor, symmetric=symmetric)
 
     @staticmethod
     def backward(ctx, grad):
@@ -43,7 +43,7 @@ class _Logm(_torch.autograd.Function):
         backward_tensor[..., n:, n:] = tensor_H
         backward_tensor[..., :n, n:] = grad
 
-        return _Logm._logm(backward_tensor).to(tensor.dtype)[..., :n, n:]
+        return _Logm._logm(backward_tensor).to(tensor.dtype)[..., :n, n:], None
 
 
 cholesky = _torch.linalg.cholesky
@@ -55,7 +55,10 @@ inv = _torch.inverse
 det = _torch.det
 solve = _torch.linalg.solve
 qr = _torch.linalg.qr
-logm = _Logm.apply
+
+
+def logm(x, *, symmetric=None):
+    return _Logm.apply(x, symmetric)
 
 
 def sqrtm(x):
@@ -118,7 +121,6 @@ def solve_sylvester(a, b, q):
     return _torch.from_numpy(solution)
 
 
-# (TODO) (sait) _torch.linalg.cholesky_ex for even faster way
 def is_single_matrix_pd(mat):
     """Check if 2D square matrix is positive definite."""
     if mat.shape[0] != mat.shape[1]:
@@ -138,6 +140,21 @@ def is_single_matrix_pd(mat):
         return False
 
 
+def is_pd(mat):
+    """Check if square matrices are positive definite."""
+    if mat.shape[-2] != mat.shape[-1]:
+        return _torch.zeros(mat.shape[:-2], dtype=_torch.bool)
+    if mat.dtype in [_torch.complex64, _torch.complex128]:
+        is_hermitian = _torch.all(
+            _torch.abs(mat - _torch.conj(mat.transpose(-2, -1))) < atol, dim=-1
+        ).all(dim=-1)
+        eigvals = _torch.linalg.eigvalsh(mat)
+        return _torch.logical_and(
+            is_hermitian, _torch.min(_torch.real(eigvals), dim=-1).values > 0
+        )
+    return _torch.linalg.cholesky_ex(mat).info == 0
+
+
 @_cast_out_to_input_dtype
 def fractional_matrix_power(A, t):
     """Compute the fractional power of a matrix."""
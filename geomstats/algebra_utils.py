@@ -157,11 +157,10 @@ def taylor_exp_even_func(point, taylor_function, order=5, tol=EPSILON):
     function_value: array-like
         Value of the function at point.
     """
-    approx = gs.einsum(
-        "k,k...->...",
-        gs.array(taylor_function["coefficients"][:order]),
-        gs.array([point**k for k in range(order)]),
-    )
+    coefficients = taylor_function["coefficients"][:order]
+    approx = coefficients[-1]
+    for coef in reversed(coefficients[:-1]):
+        approx = approx * point + coef
     point_ = gs.where(gs.abs(point) <= tol, tol, point)
     exact = taylor_function["function"](gs.sqrt(point_))
     result = gs.where(gs.abs(point) < tol, approx, exact)
@@ -8,7 +8,6 @@ Lead author: Nina Miolane.
 
 import logging
 import math
-from itertools import product
 
 from scipy.stats import beta
 
@@ -93,7 +92,7 @@ class _Hypersphere(LevelSet):
             Point projected on the hypersphere.
         """
         norm = gs.linalg.norm(point, axis=-1)
-        return gs.einsum("...,...i->...i", 1.0 / norm, point)
+        return point / norm[..., None]
 
     def to_tangent(self, vector, base_point):
         """Project a vector to the tangent space.
@@ -118,7 +117,7 @@ class _Hypersphere(LevelSet):
         sq_norm = gs.sum(base_point**2, axis=-1)
         inner_prod = self.embedding_space.metric.inner_product(base_point, vector)
         coef = inner_prod / sq_norm
-        return vector - gs.einsum("...,...j->...j", coef, base_point)
+        return vector - coef[..., None] * base_point
 
     @staticmethod
     def angle_to_extrinsic(point_angle):
@@ -187,8 +186,9 @@ class _Hypersphere(LevelSet):
         theta = point_spherical[..., 0]
         phi = point_spherical[..., 1]
 
+        sin_theta = gs.sin(theta)
         point_extrinsic = gs.stack(
-            [gs.sin(theta) * gs.cos(phi), gs.sin(theta) * gs.sin(phi), gs.cos(theta)],
+            [sin_theta * gs.cos(phi), sin_theta * gs.sin(phi), gs.cos(theta)],
             axis=-1,
         )
 
@@ -223,23 +223,23 @@ class _Hypersphere(LevelSet):
                 " only in dimension 2."
             )
 
-        axes = (2, 0, 1) if base_point_spherical.ndim == 2 else (0, 1)
         theta = base_point_spherical[..., 0]
         phi = base_point_spherical[..., 1]
         phi = gs.where(theta == 0.0, 0.0, phi)
 
-        zeros = gs.zeros_like(theta)
+        sin_theta, cos_theta = gs.sin(theta), gs.cos(theta)
+        sin_phi, cos_phi = gs.sin(phi), gs.cos(phi)
+        d_theta = tangent_vec_spherical[..., 0]
+        d_phi = tangent_vec_spherical[..., 1]
 
-        jac = gs.array(
+        return gs.stack(
             [
-                [gs.cos(theta) * gs.cos(phi), -gs.sin(theta) * gs.sin(phi)],
-                [gs.cos(theta) * gs.sin(phi), gs.sin(theta) * gs.cos(phi)],
-                [-gs.sin(theta), zeros],
-            ]
+                cos_theta * cos_phi * d_theta - sin_theta * sin_phi * d_phi,
+                cos_theta * sin_phi * d_theta + sin_theta * cos_phi * d_phi,
+                -sin_theta * d_theta,
+            ],
+            axis=-1,
         )
-        jac = gs.transpose(jac, axes)
-
-        return gs.einsum("...ij,...j->...i", jac, tangent_vec_spherical)
 
     def extrinsic_to_spherical(self, point_extrinsic):
         """Convert point from extrinsic to spherical coordinates.
@@ -310,37 +310,24 @@ class _Hypersphere(LevelSet):
         if base_point_spherical is None and base_point is not None:
             base_point_spherical = self.extrinsic_to_spherical(base_point)
 
-        axes = (2, 0, 1) if base_point_spherical.ndim == 2 else (0, 1)
         theta = base_point_spherical[..., 0]
         phi = base_point_spherical[..., 1]
 
-        theta_safe = gs.where(gs.abs(theta) < gs.atol, gs.atol, theta)
-        zeros = gs.zeros_like(theta)
-        jac_close_0 = gs.array(
-            [[gs.ones_like(theta), zeros, zeros], [zeros, gs.ones_like(theta), zeros]]
-        )
+        close_0 = gs.abs(theta) < gs.atol
+        sin_theta, cos_theta = gs.sin(theta), gs.cos(theta)
+        sin_theta_safe = gs.where(close_0, math.sin(gs.atol), sin_theta)
+        sin_phi, cos_phi = gs.sin(phi), gs.cos(phi)
+        vec_x = tangent_vec[..., 0]
+        vec_y = tangent_vec[..., 1]
+        vec_z = tangent_vec[..., 2]
 
-        jac = gs.array(
-            [
-                [
-                    gs.cos(theta) * gs.cos(phi),
-                    gs.cos(theta) * gs.sin(phi),
-                    -gs.sin(theta),
-                ],
-                [
-                    -gs.sin(phi) / gs.sin(theta_safe),
-                    gs.cos(phi) / gs.sin(theta_safe),
-                    zeros,
-                ],
-            ]
-        )
-
-        jac = gs.transpose(jac, axes)
-        jac_close_0 = gs.transpose(jac_close_0, axes)
-        theta_criterion = gs.einsum("...,...ij->...ij", theta, gs.ones_like(jac))
-        jac = gs.where(gs.abs(theta_criterion) < gs.atol, jac_close_0, jac)
+        d_theta = cos_theta * (cos_phi * vec_x + sin_phi * vec_y) - sin_theta * vec_z
+        d_phi = (cos_phi * vec_y - sin_phi * vec_x) / sin_theta_safe
 
-        return gs.einsum("...ij,...j->...i", jac, tangent_vec)
+        return gs.stack(
+            [gs.where(close_0, vec_x, d_theta), gs.where(close_0, vec_y, d_phi)],
+            axis=-1,
+        )
 
     def intrinsic_to_extrinsic_coords(self, point_intrinsic):
         """Convert point from intrinsic to extrinsic coordinates.
@@ -398,11 +385,6 @@ class _Hypersphere(LevelSet):
             "Intrinsic coordinates are only implemented in dimension 1 and 2."
         )
 
-    def _replace_values(self, samples, new_samples, indcs):
-        replaced_indices = [i for i, is_replaced in enumerate(indcs) if is_replaced]
-        value_indices = list(product(replaced_indices, range(self.dim + 1)))
-        return gs.assignment(samples, gs.flatten(new_samples), value_indices)
-
     def random_point(self, n_samples=1, bound=1.0):
         """Sample in the hypersphere from the uniform distribution.
 
@@ -437,16 +419,10 @@ class _Hypersphere(LevelSet):
         size = (n_samples, self.dim + 1)
 
         samples = gs.random.normal(size=size)
-        while True:
-            norms = gs.linalg.norm(samples, axis=1)
-            indcs = gs.isclose(norms, 0.0, atol=gs.atol)
-            num_bad_samples = gs.sum(indcs)
-            if num_bad_samples == 0:
-                break
-            new_samples = gs.random.normal(size=(num_bad_samples, self.dim + 1))
-            samples = self._replace_values(samples, new_samples, indcs)
-
-        samples = gs.einsum("..., ...i->...i", 1 / norms, samples)
+        norms = gs.linalg.norm(samples, axis=1)
+        norms = gs.where(norms == 0.0, 1.0, norms)
+
+        samples = samples / norms[..., None]
         if n_samples == 1:
             samples = gs.squeeze(samples, axis=0)
 
@@ -502,7 +478,7 @@ class _Hypersphere(LevelSet):
             scalar = gs.random.rand(n_samples)
 
             coord_x = 1.0 + 1.0 / kappa * gs.log(
-                scalar + (1.0 - scalar) * gs.exp(gs.array(-2.0 * kappa))
+                scalar + (1.0 - scalar) * math.exp(-2.0 * kappa)
             )
             coord_x = gs.to_ndarray(coord_x, to_ndim=2, axis=1)
             coord_yz = gs.sqrt(1.0 - coord_x**2) * unit_vector
@@ -537,9 +513,7 @@ class _Hypersphere(LevelSet):
                 )
             coord_x = gs.concatenate(result)
             coord_rest = _Hypersphere(dim - 1).random_uniform(n_accepted)
-            coord_rest = gs.einsum(
-                "...,...i->...i", gs.sqrt(1 - coord_x**2), coord_rest
-            )
+            coord_rest = gs.sqrt(1 - coord_x**2)[..., None] * coord_rest
             sample = gs.concatenate([coord_x[..., None], coord_rest], axis=1)
 
         if mu is not None:
@@ -742,15 +716,12 @@ class HypersphereMetric(RiemannianMetric):
             Point on the hypersphere equal to the Riemannian exponential
             of tangent_vec at the base point.
         """
-        hypersphere = Hypersphere(dim=self.dim)
-        proj_tangent_vec = hypersphere.to_tangent(tangent_vec, base_point)
+        proj_tangent_vec = self._space.to_tangent(tangent_vec, base_point)
         norm2 = self.embedding_metric.squared_norm(proj_tangent_vec)
 
         coef_1 = utils.taylor_exp_even_func(norm2, utils.cos_close_0, order=4)
         coef_2 = utils.taylor_exp_even_func(norm2, utils.sinc_close_0, order=4)
-        exp = gs.einsum("...,...j->...j", coef_1, base_point) + gs.einsum(
-            "...,...j->...j", coef_2, proj_tangent_vec
-        )
+        exp = coef_1[..., None] * base_point + coef_2[..., None] * proj_tangent_vec
 
         return exp
 
@@ -779,9 +750,7 @@ class HypersphereMetric(RiemannianMetric):
         coef_2_ = utils.taylor_exp_even_func(
             squared_angle, utils.inv_tanc_close_0, order=5
         )
-        log = gs.einsum("...,...j->...j", coef_1_, point) - gs.einsum(
-            "...,...j->...j", coef_2_, base_point
-        )
+        log = coef_1_[..., None] * point - coef_2_[..., None] * base_point
 
         return log
 
@@ -868,13 +837,11 @@ class HypersphereMetric(RiemannianMetric):
                 )
         theta = gs.linalg.norm(direction, axis=-1)
         eps = gs.where(theta == 0.0, 1.0, theta)
-        normalized_b = gs.einsum("...,...i->...i", 1 / eps, direction)
-        pb = gs.dot(tangent_vec, normalized_b)
-        p_orth = tangent_vec - gs.einsum("...,...i->...i", pb, normalized_b)
-        transported = (
-            -gs.einsum("...,...i->...i", gs.sin(theta) * pb, base_point)
-            + gs.einsum("...,...i->...i", gs.cos(theta) * pb, normalized_b)
-            + p_orth
+        normalized_b = direction / eps[..., None]
+        pb = gs.dot(tangent_vec, normalized_b)[..., None]
+        theta = theta[..., None]
+        transported = tangent_vec + pb * (
+            (gs.cos(theta) - 1.0) * normalized_b - gs.sin(theta) * base_point
         )
         return transported
 
@@ -905,18 +872,27 @@ class HypersphereMetric(RiemannianMetric):
             )
 
         point = gs.to_ndarray(point, to_ndim=2)
-        christoffel = []
-        for sample in point:
-            gamma_0 = gs.array([[0, 0], [0, -gs.sin(sample[0]) * gs.cos(sample[0])]])
-            gamma_1 = gs.array(
-                [
-                    [0, gs.cos(sample[0]) / gs.sin(sample[0])],
-                    [gs.cos(sample[0]) / gs.sin(sample[0]), 0],
-                ]
-            )
-            christoffel.append(gs.stack([gamma_0, gamma_1]))
+        theta = point[:, 0]
+        sin_theta = gs.sin(theta)
+        cos_theta = gs.cos(theta)
+        cot_theta = cos_theta / sin_theta
+        zeros = gs.zeros_like(theta)
 
-        christoffel = gs.stack(christoffel)
+        gamma_0 = gs.stack(
+            [
+                gs.stack([zeros, zeros], axis=-1),
+                gs.stack([zeros, -sin_theta * cos_theta], axis=-1),
+            ],
+            axis=-2,
+        )
+        gamma_1 = gs.stack(
+            [
+                gs.stack([zeros, cot_theta], axis=-1),
+                gs.stack([cot_theta, zeros], axis=-1),
+            ],
+            axis=-2,
+        )
+        christoffel = gs.stack([gamma_0, gamma_1], axis=1)
         if gs.ndim(christoffel) == 4 and gs.shape(christoffel)[0] == 1:
             christoffel = gs.squeeze(christoffel, axis=0)
         return christoffel
@@ -950,8 +926,8 @@ class HypersphereMetric(RiemannianMetric):
         """
         inner_ac = self.inner_product(tangent_vec_a, tangent_vec_c)
         inner_bc = self.inner_product(tangent_vec_b, tangent_vec_c)
-        first_term = gs.einsum("...,...i->...i", inner_bc, tangent_vec_a)
-        second_term = gs.einsum("...,...i->...i", inner_ac, tangent_vec_b)
+        first_term = inner_bc[..., None] * tangent_vec_a
+        second_term = inner_ac[..., None] * tangent_vec_b
         return -first_term + second_term
 
     def _normalization_factor_odd_dim(self, variances):
@@ -298,15 +298,7 @@ class Matrices(VectorSpace):
         is_pd : array-like, shape=[...,]
             Boolean evaluating if the matrix is positive definite.
         """
-        if mat.ndim == 2:
-            return gs.array(gs.linalg.is_single_matrix_pd(mat))
-
-        shape = mat.shape
-        if mat.ndim > 3:
-            mat = gs.reshape(mat, (-1,) + shape[-2:])
-
-        is_pd = gs.array([gs.linalg.is_single_matrix_pd(m) for m in mat])
-        return gs.reshape(is_pd, shape[:-2])
+        return gs.linalg.is_pd(mat)
 
     @classmethod
     def is_spd(cls, mat, atol=gs.atol):
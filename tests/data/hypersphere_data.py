@@ -18,18 +18,6 @@ class HypersphereTestData(_LevelSetTestData):
 
     Space = Hypersphere
 
-    def replace_values_test_data(self):
-        smoke_data = [
-            dict(
-                dim=4,
-                points=gs.ones((3, 5)),
-                new_points=gs.zeros((2, 5)),
-                indcs=[True, False, True],
-                expected=gs.stack([gs.zeros(5), gs.ones(5), gs.zeros(5)]),
-            )
-        ]
-        return self.generate_tests(smoke_data)
-
     def angle_to_extrinsic_test_data(self):
         smoke_data = [
             dict(
@@ -287,6 +275,18 @@ class HypersphereMetricTestData(_RiemannianMetricTestData):
         smoke_data = [dict(dim=2, point=point, expected=[2, 2, 2, 2])]
         return self.generate_tests(smoke_data)
 
+    def christoffels_test_data(self):
+        """Test the Christoffel symbols in spherical coordinates."""
+        point = gs.array([[gs.pi / 2, 0.0], [gs.pi / 4, gs.pi / 3]])
+        expected = gs.array(
+            [
+                [[[0.0, 0.0], [0.0, 0.0]], [[0.0, 0.0], [0.0, 0.0]]],
+                [[[0.0, 0.0], [0.0, -0.5]], [[0.0, 1.0], [1.0, 0.0]]],
+            ]
+        )
+        smoke_data = [dict(dim=2, point=point, expected=expected)]
+        return self.generate_tests(smoke_data)
+
     def riemann_tensor_spherical_coords_shape_test_data(self):
         """Test that the Riemann tensor is of the right shape.
 
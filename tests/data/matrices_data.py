@@ -225,6 +225,7 @@ class MatricesTestData(_VectorSpaceTestData):
             dict(m=2, n=2, mat=[EYE_2, MINUS_EYE_2], expected=[True, False]),
             dict(m=3, n=3, mat=[MAT2_33, MAT3_33], expected=[False, False]),
             dict(m=3, n=3, mat=[MAT2_33, MAT3_33], expected=[False, False]),
+            dict(m=3, n=3, mat=[MAT4_33, MAT4_33], expected=[True, True]),
         ]
         return self.generate_tests(smoke_data)
 
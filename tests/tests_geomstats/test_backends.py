@@ -585,6 +585,38 @@ class TestBackends(tests.conftest.TestCase):
         s_r = gs.linalg.svd(gs_point, compute_uv=compute_uv)
         self.assertAllClose(s, s_r)
 
+    def test_logm_symmetric(self):
+        mat = gs.random.rand(2, 3, 3)
+        spd = gs.matmul(gs.transpose(mat, (0, 2, 1)), mat) + gs.eye(3)
+        expected = gs.linalg.logm(spd)
+        result_sym = gs.linalg.logm(spd, symmetric=True)
+        result_gen = gs.linalg.logm(spd, symmetric=False)
+        self.assertAllClose(result_sym, expected)
+        self.assertAllClose(result_gen, expected)
+
+    @tests.conftest.autograd_and_torch_only
+    def test_logm_symmetric_backward(self):
+        mat = gs.array([[2.0, 0.5, 0.1], [0.5, 1.5, 0.2], [0.1, 0.2, 1.0]])
+        mat = gs.cast(mat, gs.float64)
+
+        def loss(p):
+            return gs.sum(gs.linalg.logm(p) ** 2)
+
+        def loss_sym(p):
+            return gs.sum(gs.linalg.logm(p, symmetric=True) ** 2)
+
+        value, grad = gs.autodiff.value_and_grad(loss)(mat)
+        value_sym, grad_sym = gs.autodiff.value_and_grad(loss_sym)(mat)
+
+        self.assertAllClose(value_sym, value)
+        self.assertAllClose(grad_sym, grad)
+
+    def test_logm_symmetric_2x2_batch(self):
+        mat = gs.random.rand(100, 2, 2)
+        spd = gs.matmul(gs.transpose(mat, (0, 2, 1)), mat) + gs.eye(2)
+        result = gs.linalg.logm(spd)
+        self.assertAllClose(gs.linalg.expm(result), spd)
+
     @tests.conftest.np_and_autograd_only
     def test_sylvester_solve(self):
         mat = gs.random.rand(4, 3)
@@ -630,6 +662,24 @@ class TestBackends(tests.conftest.TestCase):
 
         self.assertAllClose(result, skew)
 
+    def test_general_sylvester_solve_vectorization(self):
+        gs.random.seed(0)
+        a = gs.random.rand(2, 3, 3)
+        b = gs.random.rand(2, 2, 2)
+        q = gs.random.rand(3, 2)
+        sol = gs.linalg.solve_sylvester(a, b, q)
+        result = gs.matmul(a, sol) + gs.matmul(sol, b)
+        self.assertAllClose(result, gs.stack([q, q]))
+
+    def test_general_sylvester_solve_shared_coefficients(self):
+        gs.random.seed(0)
+        a = gs.random.rand(3, 3)
+        b = gs.random.rand(2, 2)
+        q = gs.random.rand(4, 3, 2)
+        sol = gs.linalg.solve_sylvester(a, b, q)
+        result = gs.matmul(a, sol) + gs.matmul(sol, b)
+        self.assertAllClose(result, q)
+
     def test_triu(self):
         mat = gs.array([[2.0, 1.0, 1.0], [1.0, -1.5, 2.0], [-1.0, 10.0, 2.0]])
         result = gs.triu(mat)
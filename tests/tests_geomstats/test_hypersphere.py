@@ -18,13 +18,6 @@ class TestHypersphere(LevelSetTestCase, metaclass=Parametrizer):
 
     testing_data = HypersphereTestData()
 
-    def test_replace_values(self, dim, points, new_points, indcs, expected):
-        space = self.Space(dim)
-        result = space._replace_values(
-            gs.array(points), gs.array(new_points), gs.array(indcs)
-        )
-        self.assertAllClose(result, expected)
-
     def test_angle_to_extrinsic(self, dim, point, expected):
         space = self.Space(dim)
         result = space.angle_to_extrinsic(point)
@@ -170,6 +163,11 @@ class HypersphereMetricTestCase(RiemannianMetricTestCase):
         result = metric.christoffels(point)
         self.assertAllClose(gs.shape(result), expected)
 
+    def test_christoffels(self, dim, point, expected):
+        metric = self.Metric(dim)
+        result = metric.christoffels(point)
+        self.assertAllClose(result, expected)
+
     def test_riemann_tensor_spherical_coords_shape(self, base_point, expected):
         """Test the shape of the Riemann tensor on the sphere.
 
@@ -13,6 +13,7 @@ class TestHypersphereBisMetric(HypersphereMetricTestCase, metaclass=Parametrizer
 
     skip_test_exp_geodesic_ivp = True
     skip_test_dist_point_to_itself_is_zero = True
+    skip_test_christoffels = True
     skip_test_christoffels_shape = True
     skip_test_sectional_curvature = True
     skip_test_triangle_inequality_of_dist = True